@@ -0,0 +1,93 @@
+"""
+Compiled kernels for sampling conic sections.
+An arc only has a few hundred samples, too few to amortize NumPy's per call
+overhead, so the whole sweep is fused into a single jitted loop instead.
+"""
+from math import sqrt
+from typing import Tuple
+import numpy as np
+import numba as nb
+
+
+@nb.njit(cache=True, fastmath=True, boundscheck=False)
+def sample_conic(a, b, c, d, e, f, ys: np.ndarray, out_x: np.ndarray, out_y: np.ndarray) -> int:
+    """
+    Solve Ax^2 + Bxy + Cy^2 + Dx + Ey + F = 0 for x at every y in `ys`.
+    Both roots of a sample are written one after the other into `out_x`,
+    with the sample repeated in `out_y`. Samples without a real root are
+    skipped. `out_x` and `out_y` must hold at least 2 * len(ys) values.
+    Returns the number of values written.
+    """
+    count = 0
+    for i in range(ys.shape[0]):
+        y = ys[i]
+        disc = b*b*y*y - 4*a*(c*y*y + e*y + f) + 2*b*d*y + d*d
+
+        if disc >= 0:
+            sqrt_d = np.sqrt(disc)
+            out_y[count] = y
+            out_x[count] = (-b*y - d + sqrt_d)/(2*a)
+            out_y[count + 1] = y
+            out_x[count + 1] = -(b*y + d + sqrt_d)/(2*a)
+            count += 2
+
+    return count
+
+
+# every fast-math flag except the no-NaN/no-Inf ones, since NaN is the
+# result for an `x` without a real root
+FASTMATH_KEEP_NAN = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+
+@nb.njit(cache=True, fastmath=FASTMATH_KEEP_NAN)
+def y_positive(a, b, c, d, e, f, x) -> float:
+    """
+    Solve general form for `x`. Given x calculate y the positive version.
+    Equations found using `sympy solve`. NaN where there is no real root.
+    """
+    return (-b*x - d + np.sqrt(-4*a*c*x**2 - 4*a*e*x -
+                               4*a*f + b**2*x**2 + 2*b*d*x + d**2))/(2*a)
+
+
+@nb.njit(cache=True, fastmath=FASTMATH_KEEP_NAN)
+def y_negative(a, b, c, d, e, f, x) -> float:
+    return -(b*x + d + np.sqrt(-4*a*c*x**2 - 4*a*e*x -
+                               4*a*f + b**2*x**2 + 2*b*d*x + d**2))/(2*a)
+
+
+@nb.njit(cache=True, parallel=True)
+def y_both(a, b, c, d, e, f, xs: np.ndarray) -> np.ndarray:
+    """
+    Both versions of y for every x in `xs`, as an (N, 2) array of
+    (positive, negative) pairs.
+    """
+    out = np.empty((xs.size, 2))
+    for i in nb.prange(xs.size):
+        out[i, 0] = y_positive(a, b, c, d, e, f, xs[i])
+        out[i, 1] = y_negative(a, b, c, d, e, f, xs[i])
+    return out
+
+
+@nb.njit(cache=True, error_model="numpy")
+def canonical_axes(a, b, c, d, e, f) -> Tuple[float, float]:
+    """
+    `a` and `b` of the canonical form of Ax^2 + Bxy + Cy^2 + Dx + Ey + F = 0.
+    A parabola has a zero eigenvalue and a degenerate conic a zero
+    determinant, these give inf or NaN as `np.linalg` did, not an error.
+    Reference: https://en.wikipedia.org/wiki/Conic_section#Matrix_notation
+    """
+    # eigenvalues of the symmetric 2x2 | a b/2 ; b/2 c |
+    # tr^2/4 - det rewritten so it can never go negative from rounding
+    tr = a + c
+    disc = sqrt(((a - c)/2)**2 + (b/2)**2)
+    # ordered so that lambda 1 pairs with `a`, as eigvals does for b == 0
+    if a >= c:
+        l1, l2 = tr/2 + disc, tr/2 - disc  # lambda 1 and lambda 2
+    else:
+        l1, l2 = tr/2 - disc, tr/2 + disc
+
+    # determinant of the 3x3 conic matrix
+    S = a*(c*f - (e/2)**2) - (b/2)*((b/2)*f - (e/2)*(d/2)) \
+        + (d/2)*((b/2)*(e/2) - c*(d/2))
+
+    return -S/(l1**2 * l2), -S/(l1 * l2**2)
@@ -1,11 +1,17 @@
+from typing import Dict, List, Type
+from collections import defaultdict
 from .iges.iges import Iges
+from .iges.entity import Entity
 from tqdm import tqdm
 from pygmsh.geo import Geometry
 from meshio import Mesh
 
 
 class Converter:
-    
+
+    # below this many entities a progress bar costs more than it tells
+    PROGRESS_MIN_ENTITIES = 500
+
     def __init__(self) -> None:
         pass
 
@@ -21,8 +27,23 @@ class Converter:
             geo.characteristic_length_min = characteristic_length_min
             geo.characteristic_length_max = characteristic_length_max
 
-            for entity in tqdm(iges.entity_dict.values()):
-                if not entity._geometry:
-                    entity.to_vtk(iges.entity_dict, geo, lcar)
+            pending = [iges.entity_dict[key]
+                       for key in sorted(iges.pending_geometry)]
+
+            # entities of the same type are converted together
+            batches: Dict[Type[Entity], List[Entity]] = defaultdict(list)
+            for entity in pending:
+                batches[type(entity)].append(entity)
+
+            with tqdm(
+                total=len(pending),
+                mininterval=0.2,
+                smoothing=0.1,
+                disable=len(pending) <= self.PROGRESS_MIN_ENTITIES
+            ) as pbar:
+                for etype, batch in batches.items():
+                    etype.to_vtk_batch(batch, iges.entity_dict, geo, lcar)
+                    pbar.update(len(batch))
+            iges.pending_geometry.clear()
 
             return geo.generate_mesh()
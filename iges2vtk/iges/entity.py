@@ -1,10 +1,13 @@
 from typing import ClassVar, Dict, List, Optional, Union, Tuple, Any
 from dataclasses import dataclass, field
+from collections import defaultdict
 import numpy as np
 from ..common import Pointer
 from pygmsh.geo import Geometry
 from math import ceil, floor, sqrt, pi
+from functools import lru_cache
 from geomdl import BSpline
+from .._conic_kernel import y_positive, y_negative, y_both, canonical_axes
 
 
 """
@@ -20,6 +23,9 @@ Omitted entity type list
 
 Parameter = Union[str, float]
 
+# blanks of fixed width number fields read as zeros
+SPACE_TO_ZERO = bytes.maketrans(b" ", b"0")
+
 
 @dataclass
 class Entity:
@@ -42,9 +48,11 @@ class Entity:
     form: int
     entity_label: str
     subscript: int
-    # instead of just [], below is required
-    # because mutable default is not allowed
-    parameters: List[Parameter] = field(default_factory=list)
+    # numerical parameters, string parameters are NaN here and kept aside.
+    # Only filled by entities that keep the raw parameters, subclasses that
+    # unpack their own fields leave these as None instead of holding copies
+    parameters: Optional[np.ndarray] = None
+    string_parameters: Optional[Dict[int, str]] = None
 
     _geometry: Optional[Any] = None
     _render: ClassVar[bool] = True
@@ -57,17 +65,67 @@ class Entity:
         output
             status number in integer
         """
-        numbers = x.split(" ")
-        numbers = [n.zfill(2) for n in numbers]
-        return int("".join(numbers))
+        # fixed 8 column field of four 2 digit numbers, blanks are zeros
+        return int(x.replace(" ", "0"))
+
+    @staticmethod
+    def parse_status_numbers(x: np.ndarray) -> np.ndarray:
+        """
+        Vectorized `parse_status_number` over an array of raw 8 byte fields
+        """
+        # one translate over the joined fields instead of a replace per field
+        zeroed = x.tobytes().translate(SPACE_TO_ZERO)
+        return np.frombuffer(zeroed, dtype=x.dtype).astype(np.int64)
 
     def add_parameters(self, *args: List[Parameter]):
-        self.parameters += args
+        if self.parameters is None:
+            self.parameters = np.empty(0, dtype=np.float64)
+            self.string_parameters = {}
+
+        offset = len(self.parameters)
+        numbers = np.empty(len(args), dtype=np.float64)
+
+        for i, arg in enumerate(args):
+            if isinstance(arg, str):
+                self.string_parameters[offset + i] = arg
+                numbers[i] = np.nan
+            else:
+                numbers[i] = arg
+
+        self.parameters = np.concatenate((self.parameters, numbers))
+
+    def add_parameter_array(self, params: np.ndarray):
+        """
+        `add_parameters` for an entity whose parameters are all numerical,
+        given as a single float64 array. Entities with a fixed numerical
+        layout override this to slice their fields out of `params` directly.
+        """
+        self.add_parameters(*params.tolist())
 
     def to_vtk(self, entities: Dict[Pointer, "Entity"], geometry: Geometry, lcar: float = 0.1):
         """Transforms this entity into a vtk object"""
         raise NotImplementedError
 
+    @classmethod
+    def to_vtk_batch(cls, batch: List["Entity"], entities: Dict[Pointer, "Entity"], geometry: Geometry, lcar: float = 0.1):
+        """
+        Transforms every entity of this type in `batch` into vtk objects.
+        Subclasses override this to share work, such as transformations,
+        across the whole batch.
+        """
+        for entity in batch:
+            if entity._geometry:
+                continue
+
+            entity.to_vtk(entities, geometry, lcar)
+
+    @staticmethod
+    def group_by_transformation(batch: List["Entity"]) -> Dict[Pointer, List["Entity"]]:
+        groups: Dict[Pointer, List[Entity]] = defaultdict(list)
+        for entity in batch:
+            groups[entity.transformation_pointer].append(entity)
+        return groups
+
     def to_vtk_operator(self) -> Any:
         """
         Transforms this entity into a vtk operator.
@@ -89,12 +147,29 @@ class Point(Entity):  # 116
 
         if self.transformation_pointer:
             T = entities[self.transformation_pointer]
-            point = T.transform(_point.T)
+            point = T.transform(_point)
         else:
             point = _point
 
         geometry.add_point(point)
 
+    @classmethod
+    def to_vtk_batch(cls, batch: List["Entity"], entities: Dict[Pointer, "Entity"], geometry: Geometry, lcar: float = 0.1):
+        if not cls._render:
+            return
+
+        # already converted, e.g. as part of another entity
+        batch = [entity for entity in batch if not entity._geometry]
+
+        for pointer, group in cls.group_by_transformation(batch).items():
+            points = np.array([point.pos for point in group])
+
+            if pointer:
+                points = entities[pointer].transform(points)
+
+            for point in points:
+                geometry.add_point(point)
+
 
 @dataclass
 class Line(Entity):  # 110
@@ -120,6 +195,28 @@ class Line(Entity):  # 110
 
         self._geometry = geometry.add_line(point1, point2)
 
+    @classmethod
+    def to_vtk_batch(cls, batch: List["Entity"], entities: Dict[Pointer, "Entity"], geometry: Geometry, lcar: float = 0.1):
+        if not cls._render:
+            return
+
+        # already converted, e.g. as part of another entity
+        batch = [entity for entity in batch if not entity._geometry]
+
+        for pointer, group in cls.group_by_transformation(batch).items():
+            # start and end of each line, one after the other
+            points = np.array([(*line.start, *line.end)
+                              for line in group]).reshape(-1, 3)
+
+            if pointer:
+                points = entities[pointer].transform(points)
+
+            for line, (point1, point2) in zip(group, points.reshape(-1, 2, 3)):
+                point1 = geometry.add_point(point1, lcar)
+                point2 = geometry.add_point(point2, lcar)
+
+                line._geometry = geometry.add_line(point1, point2)
+
 
 @dataclass
 class CopiousData(Entity):  # 106
@@ -133,36 +230,31 @@ class CopiousData(Entity):  # 106
     TYPE2PARSE_LENGTH = {1: 2, 2: 3, 3: 6}
 
     def add_parameters(self, *args: List[Parameter]):
-        self.tuple_type: int = int(args[0])
+        self.add_parameter_array(np.asarray(args, dtype=np.float64))
+
+    def add_parameter_array(self, params: np.ndarray):
+        self.tuple_type: int = int(params[0])
 
         if self.tuple_type == 1:  # couples
-            self.common_z = args[1]
-            coordinates = args[2:]
+            self.common_z = params[1]
+            coordinates = params[2:]
         else:
             self.common_z = None
-            coordinates = args[1:]
+            coordinates = params[1:]
 
         length = self.TYPE2PARSE_LENGTH[self.tuple_type]
-        self.point_list: List[List] = self.parse_tuple(coordinates, length)
+        count = len(coordinates) // length
+        points = np.asarray(
+            coordinates[:count * length], dtype=np.float64).reshape(count, length)
 
-    def parse_tuple(self, args: List[Parameter], length: int) -> List[Tuple]:
-        tuple_list: List[List] = []
+        if self.tuple_type == 1:
+            points = np.column_stack((points, np.full(count, self.common_z)))
 
-        # /2 because 2 floats in a couple
-        if self.common_z:
-            for tuple_idx in range(int(len(args)/length)):
-                start = tuple_idx*length
-                end = (tuple_idx+1)*length
-                tuple_list.append(
-                    [*args[start: end], self.common_z])
-
-        else:
-            for tuple_idx in range(int(len(args)/length)):
-                start = tuple_idx*length
-                end = (tuple_idx+1)*length
-                tuple_list.append(args[start: end])
+        self.point_array: np.ndarray = points
 
-        return tuple_list
+    @property
+    def point_list(self) -> List[np.ndarray]:
+        return list(self.point_array)
 
     def to_vtk(self, entities: Dict[Pointer, "Entity"], geometry: Geometry, lcar: float = 0.1):
         if not self._render:
@@ -170,8 +262,11 @@ class CopiousData(Entity):  # 106
         """
         Not a mesh, so this can be discarded
         """
-        for tuple_point in self.point_list:
-            geometry.add_point(tuple_point)
+        # the points are never referenced again, so gmsh is called directly
+        # instead of wrapping every point in a pygmsh `Point`
+        add_point = geometry.env.addPoint
+        for x, y, z in self.point_array[:, :3].tolist():
+            add_point(x, y, z)
 
 
 @dataclass
@@ -194,9 +289,9 @@ class CircularArc(Entity):  # 100
         if self.transformation_pointer:
             transfomation = entities[self.transformation_pointer]
 
-            start = transfomation.transform(start)[0]
-            end = transfomation.transform(end)[0]
-            center = transfomation.transform(center)[0]
+            start = transfomation.transform(start)
+            end = transfomation.transform(end)
+            center = transfomation.transform(center)
 
         start = geometry.add_point(start, lcar)
         end = geometry.add_point(end, lcar)
@@ -246,10 +341,10 @@ class ConicArc(Entity):  # 124
         if self.transformation_pointer:
             t = entities[self.transformation_pointer]
 
-            start = t.transform(start)[0]
-            end = t.transform(end)[0]
-            center = t.transform(center)[0]
-            point_on_major = t.transform(point_on_major)[0]
+            start = t.transform(start)
+            end = t.transform(end)
+            center = t.transform(center)
+            point_on_major = t.transform(point_on_major)
 
         start = geometry.add_point(start, lcar)
         end = geometry.add_point(end, lcar)
@@ -262,44 +357,26 @@ class ConicArc(Entity):  # 124
     def get_x_range(start_pos: np.ndarray, end_pos: np.ndarray, step: float) -> np.ndarray:
 
         pos = np.arange(start=start_pos[0], stop=end_pos[0]+step, step=step)
-        neg = np.array([x * -1 for x in np.flip(pos)])
-        return np.hstack((neg, pos))
+        return np.concatenate((-pos[::-1], pos))
 
     @staticmethod
-    def get_major_raidus(a, b, c, d, e, f) -> np.float:
+    @lru_cache(maxsize=1024)
+    def get_major_raidus(a, b, c, d, e, f) -> float:
         """
         For an ellipse or hyperbola, you can find the canonical form
         from the general form.
-        We only need `a`, the major radius so `b` is not calculated
+        We only need `a`, the major radius
+        Cached on the coefficients, since many arcs share the same conic,
+        bounded since every distinct conic adds an entry.
         Reference: https://en.wikipedia.org/wiki/Conic_section#Matrix_notation
         """
-        sol = np.array([[a, b/2], [b/2, c]])
-        conic_matrix = np.array([[a, b/2, d/2], [b/2, c, e/2], [d/2, e/2, f]])
-
-        eig = np.linalg.eigvals(sol)
-        l1, l2 = eig  # lambda 1 and lambda 2
-        S = np.linalg.det(conic_matrix)
-
-        canonical_a = -S/(l1**2 * l2)
+        canonical_a, _ = canonical_axes(a, b, c, d, e, f)
         return canonical_a
 
-    @staticmethod
-    def get_y_positive(a, b, c, d, e, f, x) -> Tuple[float, float]:
-        """
-        Solve general form for `x`. Given x calculate y the positive version.
-        Equations found using `sympy solve`.
-        """
-        y_positive = (-b*x - d + sqrt(-4*a*c*x**2 - 4*a*e*x -
-                                      4*a*f + b**2*x**2 + 2*b*d*x + d**2))/(2*a)
-
-        return y_positive
-
-    @staticmethod
-    def get_y_negative(a, b, c, d, e, f, x) -> Tuple[float, float]:
-        y_negative = -(b*x + d + sqrt(-4*a*c*x**2 - 4*a*e*x -
-                                      4*a*f + b**2*x**2 + 2*b*d*x + d**2))/(2*a)
-
-        return y_negative
+    # compiled kernels, see `_conic_kernel`
+    get_y_positive = staticmethod(y_positive)
+    get_y_negative = staticmethod(y_negative)
+    get_y_both = staticmethod(y_both)
 
 
 @dataclass
@@ -313,19 +390,31 @@ class Transformation(Entity):  # 124
 
     """
 
-    def add_parameters(self, *args: List[float]):
-        r11, r12, r13, t1, \
-            r21, r22, r23, t2, \
-            r31, r32, r33, t3 = (args[:12])
-
-        self.r = np.array([[r11, r12, r13],
-                           [r21, r22, r23],
-                           [r31, r32, r33]])
-        self.t = np.array([[t1, t2, t3]])
-
-    def transform(self, coordinate: np.array) -> np.array:
+    def add_parameters(self, *args: List[Parameter]):
+        self.add_parameter_array(np.asarray(args, dtype=np.float64))
+
+    def add_parameter_array(self, params: np.ndarray):
+        # rows of | R T |
+        matrix = params[:12].reshape(3, 4)
+        self.r = matrix[:, :3]
+        self.t = matrix[:, 3]
+        # points are rows, so products are taken with the transpose
+        self.r_t = np.ascontiguousarray(self.r.T)
+        # same transformation in homogeneous coordinates
+        self.affine = np.vstack((matrix, [0.0, 0.0, 0.0, 1.0]))
+
+    def transform(self, coordinate: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Transforms a (3,) point or an (N, 3) stack of points at once.
+        When `out`, a float64 array of the same shape, is given the result is
+        written into it instead of a new array.
+        """
+        if out is None:
+            return coordinate.dot(self.r_t) + self.t
 
-        return self.r.dot(coordinate) + self.t
+        np.dot(coordinate, self.r_t, out=out)
+        out += self.t
+        return out
 
     def to_vtk(self, entities: Dict[Pointer, "Entity"], geometry: Geometry, lcar: float = 0.1):
         if not self._render:
@@ -369,37 +458,36 @@ class RationalBSplineCurve(Entity):
     """
 
     def add_parameters(self, *args: List[Parameter]):
+        self.add_parameter_array(np.asarray(args, dtype=np.float64))
+
+    def add_parameter_array(self, params: np.ndarray):
         self.K, self.degree, self.flag1, self.flag2, self.flag3, self.flag4 \
-            = map(lambda x: int(x), args[:6])
+            = map(int, params[:6])
 
         weight_start_idx = 8 + self.K + self.degree
         control_start_idx = weight_start_idx + self.K + 1
         etc_start_idx = control_start_idx + 3 * self.K + 3
-        knot_range = range(6, weight_start_idx)
-        weight_range = range(weight_start_idx, control_start_idx)
 
-        self.v0, self.v1, self.xn, self.yn, self.zn = args[etc_start_idx:]
+        self.v0, self.v1, self.xn, self.yn, self.zn = params[etc_start_idx:]
 
-        self.knots = [args[i] for i in knot_range]
-        self.weights = [args[i] for i in weight_range]
-        temp_control_points = args[control_start_idx:etc_start_idx]
-        self.control_points = [temp_control_points[i:i + 3]
-                               for i in range(0, len(temp_control_points), 3)]
+        self.knots = np.asarray(params[6:weight_start_idx], dtype=np.float64)
+        self.weights = np.asarray(
+            params[weight_start_idx:control_start_idx], dtype=np.float64)
+        self.control_points = np.asarray(
+            params[control_start_idx:etc_start_idx], dtype=np.float64).reshape(-1, 3)
 
     def to_vtk(self, entities: Dict[Pointer, "Entity"], geometry: Geometry, lcar: float = 0.1):
         if not self._render:
             return
 
-        points = []
-        for point in self.control_points:
-
-            if self.transformation_pointer:
-                transfomation = entities[self.transformation_pointer]
+        points = self.control_points
+        if self.transformation_pointer:
+            transfomation = entities[self.transformation_pointer]
 
-                point = transfomation.transform(point)[0]
+            points = transfomation.transform(points)
 
-            point = geometry.add_point(point, lcar)
-            points.append(point)
+        points = [geometry.add_point(point, lcar)
+                  for point in points.tolist()]
 
         spline = geometry.add_bspline(points)
 
@@ -413,33 +501,30 @@ class RationalBSplineSurface(Entity):
     """
 
     def add_parameters(self, *args: List[Parameter]):
+        self.add_parameter_array(np.asarray(args, dtype=np.float64))
+
+    def add_parameter_array(self, params: np.ndarray):
         start_idx = 9
         self.k1, self.k2, self.m1, self.m2, \
             self.flag1, self.flag2, self.flag3, self.flag4, self.flag5 \
-            = map(lambda x: int(x), args[:start_idx])
+            = map(int, params[:start_idx])
 
         knot2_start = start_idx + self.k2 + self.m1 + 2
         weight_start = knot2_start + self.k1 + self.m2 + 2
-        self.knot1 = args[start_idx: knot2_start]
-        self.knot2 = args[knot2_start: weight_start]
+        self.knot1 = np.asarray(params[start_idx: knot2_start], dtype=np.float64)
+        self.knot2 = np.asarray(params[knot2_start: weight_start], dtype=np.float64)
 
         weight_count = (self.k2 + 1) * (self.k1 + 1)
         control_start = weight_start + weight_count
-        self.weights = args[weight_start: control_start]
+        self.weights = np.asarray(
+            params[weight_start: control_start], dtype=np.float64)
 
         etc_start = control_start + 3 * weight_count
 
-        self.control_points: List[List] = []
-
-        i = control_start
-        while i < etc_start:
-            self.control_points.append(np.array(args[i: i+3]))
-            i += 3
+        self.control_points = np.asarray(
+            params[control_start: etc_start], dtype=np.float64).reshape(self.k2+1, self.k1 + 1, 3)
 
-        self.control_points = np.array(
-            self.control_points).reshape(self.k2+1, self.k1 + 1, 3)
-
-        self.U0, self.U1, self.V0, self.V1 = args[etc_start:]
+        self.U0, self.U1, self.V0, self.V1 = params[etc_start:]
 
         assert len(self.knot1) == (2 + self.k2 + self.m1)
         assert len(self.knot2) == (2 + self.k1 + self.m2)
@@ -450,32 +535,21 @@ class RationalBSplineSurface(Entity):
         if not self._render:
             return
 
-        rows, cols, z = self.control_points.shape
-        # The id have to match, not just coordinates
-        top = []
-        for i in range(0, cols):
-            point = self.control_points[0, i]
-            top.append(geometry.add_point(point, lcar))
-        top_spline = geometry.add_bspline(top)
-
-        right = [top[-1]]
-        for i in range(1, rows):
-            point = self.control_points[i, cols-1]
-            right.append(geometry.add_point(point, lcar))
-        right_spline = geometry.add_bspline(right)
-
-        bottom = [right[-1]]
-        for i in range(cols-2, -1, -1):
-            point = self.control_points[rows-1, i]
-            bottom.append(geometry.add_point(point, lcar))
-        bottom_spline = geometry.add_bspline(bottom)
-
-        left = [bottom[-1]]
-        for i in range(rows-2, 0, -1):
-            point = self.control_points[i, 0]
-            left.append(geometry.add_point(point, lcar))
-        left.append(top[0])
-        left_spline = geometry.add_bspline(left)
+        cp = self.control_points
+        rows, cols, z = cp.shape
+        # the boundary as one ring, clockwise from the top left corner
+        ring = np.concatenate(
+            (cp[0], cp[1:, -1], cp[-1, -2::-1], cp[-2:0:-1, 0])).tolist()
+        # The id have to match, not just coordinates, so each point is added
+        # once and the splines share the corner points by slicing
+        points = [geometry.add_point(point, lcar) for point in ring]
+
+        top_spline = geometry.add_bspline(points[:cols])
+        right_spline = geometry.add_bspline(points[cols-1:cols+rows-1])
+        bottom_spline = geometry.add_bspline(
+            points[cols+rows-2:2*cols+rows-2])
+        left_spline = geometry.add_bspline(
+            points[2*cols+rows-3:] + points[:1])
 
         loop = geometry.add_curve_loop(
             [top_spline, right_spline, bottom_spline, left_spline])
@@ -499,6 +573,7 @@ class Face(Entity):
 @dataclass
 class LoopEdge:
     """Represents edge in a loop. NOT AN ENTITY"""
+    __slots__ = ("type", "pointer", "index", "flag", "curves")
 
     type: int
     pointer: int
@@ -513,34 +588,29 @@ class Loop(Entity):
 
     def add_parameters(self, *args: List[Parameter]):
         self.edge_count = int(args[0])
-        self.edges: List[LoopEdge] = []
+        self.edges: List[LoopEdge] = [None] * self.edge_count
 
-        edge_idx = 0
         arg_idx = 1
-        while edge_idx < self.edge_count:
-            edge_type = int(args[arg_idx])
-            edge_list_pointer = int(args[arg_idx + 1])
-            edge_index = int(args[arg_idx + 2])
-            flag = bool(args[arg_idx + 3])
-            curve_count = int(args[arg_idx + 4])
+        for edge_idx in range(self.edge_count):
+            edge_type, edge_list_pointer, edge_index, flag, curve_count \
+                = map(int, args[arg_idx:arg_idx + 5])
             arg_idx += 5
 
-            curves = []
-            for i in range(curve_count):
-                iso = bool(args[arg_idx])
-                psc = int(args[arg_idx + 1])
-                curves.append((iso, psc))
-                arg_idx += 2
-
-            edge = LoopEdge(edge_type, edge_list_pointer,
-                            edge_index, flag, curves)
-            self.edges.append(edge)
+            block = args[arg_idx:arg_idx + 2 * curve_count]
+            # (isoparametric flag, curve pointer) pairs
+            curves = [(int(flag) != 0, int(pointer))
+                      for flag, pointer in zip(block[::2], block[1::2])]
+            arg_idx += 2 * curve_count
 
-            edge_idx += 1
+            self.edges[edge_idx] = LoopEdge(
+                edge_type, edge_list_pointer, edge_index, flag != 0, curves)
 
 
 @dataclass
 class Edge:
+    __slots__ = ("curve", "start_vertex_list", "start_vertex_index",
+                 "end_vertex_list", "end_vertex_index")
+
     curve: int
     start_vertex_list: int
     start_vertex_index: int
@@ -552,22 +622,22 @@ class Edge:
 class EdgeList(Entity):
 
     def add_parameters(self, *args: List[Parameter]):
-        edge_count = int(args[0])
-
-        edge_index = 0
-        arg_index = 1
-        self.edges: List[Edge] = []
+        self.add_parameter_array(np.asarray(args, dtype=np.float64))
 
-        while edge_index < edge_count:
-            e = Edge(*map(lambda x: int(x), args[arg_index:arg_index+5]))
-            self.edges.append(e)
+    def add_parameter_array(self, params: np.ndarray):
+        edge_count = int(params[0])
+        # (N, 5) rows laid out in the same order as the fields of `Edge`
+        self.edges: np.ndarray = np.asarray(
+            params[1:1 + 5 * edge_count], dtype=np.int32).reshape(edge_count, 5)
 
-            arg_index += 5
-            edge_index += 1
+    def __getitem__(self, index: int) -> Edge:
+        return Edge(*map(int, self.edges[index]))
 
 
 @dataclass
 class Vertex:
+    __slots__ = ("x", "y", "z")
+
     x: float
     y: float
     z: float
@@ -577,17 +647,16 @@ class Vertex:
 class VertexList(Entity):
 
     def add_parameters(self, *args: List[Parameter]):
-        vertex_count = int(args[0])
+        self.add_parameter_array(np.asarray(args, dtype=np.float64))
 
-        vertex_index = 0
-        arg_index = 1
-        self.vertices: List[Vertex] = []
+    def add_parameter_array(self, params: np.ndarray):
+        vertex_count = int(params[0])
+        # (N, 3) coordinates, one row per vertex
+        self.vertices: np.ndarray = np.asarray(
+            params[1:1 + 3 * vertex_count], dtype=np.float64).reshape(vertex_count, 3)
 
-        while vertex_index < vertex_count:
-            v = Vertex(*args[arg_index: arg_index + 3])
-            self.vertices.append(v)
-            arg_index += 3
-            vertex_index += 1
+    def __getitem__(self, index: int) -> Vertex:
+        return Vertex(*self.vertices[index])
 
 
 @dataclass
@@ -692,7 +761,7 @@ class TrimmedSurface(Entity):
     def add_parameters(self, *args: List[Parameter]):
         self.surface = Pointer(args[0])
         # 0: Boundary is boudary of surface 1: otherwise
-        self.is_outer_boundary = bool(args[1])
+        self.is_outer_boundary = int(args[1]) != 0
         # args[2] is inner curve count
         self.outer_bound = Pointer(args[3])
         self.inners = list(map(Pointer, args[4:]))
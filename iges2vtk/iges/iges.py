@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 from .entity import Entity
 from ..common import Pointer, PreprocessorData
 
@@ -16,11 +16,16 @@ ENTRY_LENGTH = 8
 
 class Iges:
 
+    __slots__ = ("entity_dict", "pending_geometry",
+                 "description", "global_data_list")
+
     DEFAULT_DELIMITER = ","
     DEFAULT_ENDING = ";"
 
     def __init__(self) -> None:
         self.entity_dict: Dict[Pointer, Entity] = {}
+        # entities that still have to be converted by `to_vtk`
+        self.pending_geometry: Set[Pointer] = set()
 
         self.description: str = ""
         self.global_data_list: List[PreprocessorData] = []
@@ -30,12 +35,12 @@ class Iges:
         if entity is not None:
             self.entity_dict[sequence] = entity
 
+            if type(entity).to_vtk is not Entity.to_vtk:
+                self.pending_geometry.add(sequence)
+
     def get_entity(self, pointer: Pointer) -> Optional[Entity]:
 
-        try:
-            return self.entity_dict[pointer]
-        except KeyError:
-            return None
+        return self.entity_dict.get(pointer)
 
     @property
     def delimiter(self) -> Optional[str]:
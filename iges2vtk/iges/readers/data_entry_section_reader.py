@@ -1,8 +1,9 @@
-from typing import Callable, List
+from typing import Callable, List, Optional
 from ..iges import Iges, ENTRY_LENGTH
 from ..entity import *
-from .section_reader import SectionReader, IgesLine, chunk_string
-from collections import defaultdict
+from .section_reader import SectionReader, IgesLine
+import numpy as np
+import sys
 
 etype2class: Dict[int, Callable] = {
     100: CircularArc,
@@ -24,6 +25,11 @@ etype2class: Dict[int, Callable] = {
     510: Face,
 }
 
+# `etype2class` as a list indexed by the entity type number
+ETYPE_TABLE: List[Optional[Callable]] = [None] * (max(etype2class) + 1)
+for _type_number, _etype in etype2class.items():
+    ETYPE_TABLE[_type_number] = _etype
+
 
 class DataEntrySectionReader(SectionReader):
     """
@@ -32,83 +38,87 @@ class DataEntrySectionReader(SectionReader):
     into 10 8-character fields, and ach entity is given 2 lines of the section.
     This indicates that every entity has 20 fields in the Entry section.
 
+    Every record has the same fixed layout, so the lines of the whole section
+    are buffered and parsed in a single pass over a NumPy view by
+    `end_section`. There is no `unit_ready` check of its own.
+
     Example
     ------
     >>> data_reader = DataEntrySectionReader()
     >>> data_reader.iges = Iges()
-    >>> line1 = IgesLine("     308      01               1       0               0        00020201","D","01")
-    >>> line2 = IgesLine("     308       0               1                         SUBFIG1        ","D","02")
+    >>> line1 = IgesLine("     308      01               1       0               0        00020201","D",1)
+    >>> line2 = IgesLine("     308       0               1                         SUBFIG1        ","D",2)
     >>> data_reader.read_line(line1)
-    >>> data_reader.unit_ready()
-    False
     >>> data_reader.read_line(line2)
-    >>> data_reader.unit_ready()
-    True
-    >>> data_reader.unit_buffer
-    ['     308', '      01', '        ', '       1', '       0', '        ', '       0', '        ', '00020201', '     308', '       0', '        ', '       1', '        ', '        ', '        ', ' SUBFIG1', '        ']
-    >>> data_reader.process_unit()
+    >>> data_reader.end_section(2)
     >>> data_reader.unit_buffer
     []
-    >>> data_reader.iges.entities.values()
-    [Entity(type_number=308, pd_pointer=1, structure=0, line_font_pattern=1, level=0, view=0, transformation_matrix_pointer=0, label_display_associativity=0, status_number=20201, line_weight=0, color=0, parameter_line_count=1, form=0, entity_label=' SUBFIG1', subscript=0, parameters=[])]
+    >>> data_reader.iges.entity_dict[1].status_number
+    20201
     """
 
-    FIELD_COUNT = 15
+    FIELD_COUNT = 18
+    # a line holds 9 fields, the 10th is the section code and sequence number
+    LINE_LENGTH = 9 * ENTRY_LENGTH
+    # integer fields of a record in the order of the `Entity` constructor,
+    # without the status number and the entity label. Skipped are the
+    # second type number (9) and the two reserved fields (14, 15)
+    INT_FIELDS = [0, 1, 2, 3, 4, 5, 6, 7, 10, 11, 12, 13, 17]
+    STATUS_FIELD = 8
+    LABEL_FIELD = 16
+    # labels may hold characters outside ASCII, those that latin-1 can not
+    # represent are replaced with '?'
+    ENCODING = "latin-1"
 
     def __init__(self) -> None:
         super().__init__()
 
     def read_line(self, line: IgesLine):
-        content = line.content
-        chunks = chunk_string(content, ENTRY_LENGTH)
-
-        self.unit_buffer += chunks
+        # one byte per column keeps the fixed width fields aligned
+        content = line.content.encode(
+            self.ENCODING, "replace").ljust(self.LINE_LENGTH)
+        self.unit_buffer.append(content[:self.LINE_LENGTH])
 
     def process_unit(self, sequence: int):
         """
-        Creates entity and appends to iges.
+        Creates the entities of every buffered line and appends them to iges.
+        `sequence` is the sequence number of the last buffered line.
+        """
+        first_sequence = sequence - len(self.unit_buffer) + 1
+        self.read_section(b"".join(self.unit_buffer), first_sequence)
+        self.reset_unit_buffer()
+
+    def read_section(self, content: bytes, sequence: int):
+        """
+        Creates entities from `content`, the 72 column contents of directory
+        entry lines joined together. `sequence` is the sequence number of the
+        first line.
         Examples and the document does not match. It is assumed that
         empty entry means default value of 0
         """
+        fields = np.frombuffer(
+            content, dtype=f"S{ENTRY_LENGTH}").reshape(-1, self.FIELD_COUNT)
 
-        t = self.unit_buffer
+        numbers = np.char.strip(fields[:, self.INT_FIELDS])
+        numbers[numbers == b""] = b"0"
+        numbers = numbers.astype(np.int64).tolist()
 
-        entity_param = []
-        for i, entry in enumerate(t):
+        status_numbers = Entity.parse_status_numbers(
+            fields[:, self.STATUS_FIELD]).tolist()
+        labels = fields[:, self.LABEL_FIELD].tolist()
 
-            if i in [9, 14, 15]:
-                # skip these values
+        for i, (n, status_number, label) in enumerate(zip(numbers, status_numbers, labels)):
+            etype = ETYPE_TABLE[n[0]] if 0 <= n[0] < len(ETYPE_TABLE) else None
+            if etype is None:
                 continue
 
-            elif i == 8:  # status number
-                param = Entity.parse_status_number(entry)
-
-            elif i == 16:  # entity label
-                param = entry  # a string type
-
-            else:
-                filled = entry.strip()
-                param = int(filled) if filled else 0
-
-            entity_param.append(param)
-
-        try:
-            etype = etype2class[entity_param[0]]
-            e = etype(*entity_param)
-            self.iges.add_entity(e, sequence - 1)
-        except KeyError:
-            pass
-
-        self.reset_unit_buffer()
+            # shared between entities with the same label
+            label = sys.intern(label.decode(self.ENCODING))
+            entity = etype(*n[:8], status_number, *n[8:12], label, n[12])
+            self.iges.add_entity(entity, sequence + 2 * i)
 
     def reset_unit_buffer(self):
-        self.unit_buffer: List[str] = []
-
-    def unit_ready(self) -> bool:
-        # 20 per each line,
-        # where 1 of each line is section code and sequence number, which is
-        # not parsed, so 9*2
-        return len(self.unit_buffer) >= self.FIELD_COUNT
+        self.unit_buffer: List[bytes] = []
 
 
 if __name__ == "__main__":
@@ -1,11 +1,17 @@
 from collections import namedtuple
+import re
 from typing import List, Tuple
 from ..iges import Iges, PreprocessorData
 from .section_reader import SectionReader, IgesLine
 
 COMMA = ","
 H = "H"
-UNIT_ENDS = [COMMA, H]
+UNIT_ENDS = frozenset((COMMA, H))
+# everything up to and including the first unit end. Matched at the current
+# position instead of iterated over, since string data can hold ',' and 'H'
+_ENDS = re.escape("".join(sorted(UNIT_ENDS)))
+DATA_PATTERN = re.compile(f"[^{_ENDS}]*[{_ENDS}]")
+
 class GlobalSectionReader(SectionReader):
     """
     Reader for the 'Global' section.
@@ -45,12 +51,13 @@ class GlobalSectionReader(SectionReader):
 
         content = (self.left_over + line.content).strip()
         if content[-1] == ";":
-            content = content.replace(";",",")
+            # only the ending, a ';' inside string data stays as it is
+            content = content[:-1] + COMMA
         self.reset_left_over()
 
         i = 0
         while i < len(content):
-            data_type, length = self.identify_data(content[i:])
+            data_type, length = self.identify_data(content, i)
 
             if data_type == COMMA:
                 # It's a numerical data
@@ -61,26 +68,25 @@ class GlobalSectionReader(SectionReader):
             i += 1
 
     @staticmethod
-    def identify_data(remaining_line: str) -> Tuple[str, int]:
+    def identify_data(content: str, start: int = 0) -> Tuple[str, int]:
         """
-        1. Identify type of next data
+        1. Identify type of next data from `start`
             H: string
             ,: int
         2. Identify length of next data
-        By counting number of strings until ',' or 'H' is met
+        By matching up to the first ',' or 'H' after `start`
         """
-        length = 0
-        # UNIT_ENDS = [",", "H"] replaced for numba accel.
-        while remaining_line[length] not in [",", "H"]: 
-            length += 1
-        data_type = remaining_line[length]
-        
-        return data_type, length
+        match = DATA_PATTERN.match(content, start)
+        if match is None:
+            raise IndexError("data does not end with ',' or 'H'")
+
+        end = match.end() - 1
+        return content[end], end - start
 
     def parse_numerical(self, i: int, length: int, content: str) -> int:
         """Parse a numerical data and return the index to look at"""
         string = content[i:i+length]
-        data = float(string) if string else float()
+        data = float(string) if string else 0.0
         self.unit_buffer.append(data)
         i += length
         return i
@@ -4,12 +4,14 @@ from .data_entry_section_reader import DataEntrySectionReader
 from .parameter_section_reader import ParameterSectionReader
 from .section_reader import IgesLine, Section, SectionReader
 from ..iges import Iges
-from typing import Dict, TextIO
+from typing import Dict, Optional
 from tqdm import tqdm
-import mpipe as mp
 
 class IgesReader:
 
+    # lines read between progress bar updates
+    PROGRESS_STEP = 1024
+
     def __init__(self) -> None:
         self.start_reader = StartSectionReader()
         self.global_reader = GlobalSectionReader()
@@ -32,26 +34,53 @@ class IgesReader:
         iges = Iges()
         self.distribute_iges(iges)
         
-        # setup pipeline
-
+        # read at once, the records are short and the whole file is needed
         with open(filename, 'r') as file:
-            pbar = tqdm()
-            while (line := self.parse_line(file)).section != Section.Terminal.value:
-                reader = self.reader_map[line.section]
-                reader.read_line(line)
-
-                if reader.unit_ready():
-                    reader.process_unit(line.sequence)
-                pbar.update()
-            pbar.close()
+            lines = file.read().splitlines()
+
+        pbar = tqdm(total=len(lines))
+        section_reader: Optional[SectionReader] = None
+        sequence = 0
+        line_count = 0
+        # bound once, they are looked up for every line
+        reader_map = self.reader_map
+        parse_line = self.parse_line
+        terminal = Section.Terminal.value
+        progress_step = self.PROGRESS_STEP
+        for raw_line in lines:
+            line = parse_line(raw_line)
+            if line.section == terminal:
+                break
+
+            reader = reader_map[line.section]
+
+            if reader is not section_reader:
+                if section_reader is not None:
+                    section_reader.end_section(sequence)
+                section_reader = reader
+
+            reader.read_line(line)
+
+            if reader.unit_ready():
+                reader.process_unit(line.sequence)
+            sequence = line.sequence
+
+            line_count += 1
+            if line_count % progress_step == 0:
+                pbar.update(progress_step)
+
+        if section_reader is not None:
+            section_reader.end_section(sequence)
+        pbar.update(line_count % progress_step)
+        pbar.close()
         return iges
 
-    def parse_line(self, file: TextIO) -> IgesLine:
-        """Read a line from file, convert it to IgesLine"""
-        line = file.readline()
+    def parse_line(self, line: str) -> IgesLine:
+        """Convert a line of the file to IgesLine"""
         content = line[:72]
         section = line[72]
-        sequence_number = int(line[73:-1].replace(' ', '0'))
+        # right justified, int() skips the padding
+        sequence_number = int(line[73:80])
         iges_line = IgesLine(content, section, sequence_number)
         return iges_line
 
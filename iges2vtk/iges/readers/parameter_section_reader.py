@@ -1,4 +1,6 @@
 from typing import List, Optional, Union
+from itertools import islice
+import numpy as np
 from .section_reader import SectionReader, IgesLine, read_hollerith
 from ...common import Pointer
 
@@ -9,32 +11,46 @@ class ParameterSectionReader(SectionReader):
 
     Example
     ------
-    >>> preader = ParameterSectionReader(Iges())
-    >>> preader.iges.preprocessor_datas += [',', ';']
-    >>> e = Entity(type_number=308, pd_pointer=1, structure=0, line_font_pattern=1, level=0, view=0, transformation_matrix_pointer=0, label_display_associativity=0, status_number=20201, line_weight=0, color=0, parameter_line_count=1, form=0, entity_label=' SUBFIG1', subscript=0, parameters=[])
-    >>> preader.iges.add_entity(e)
-    >>> preader.unit_ready()
-    False
-    >>> line = IgesLine("308,0,6HPADBLK,4,03,05,07,09;                                         01", "P", "01")
+    >>> from iges2vtk.iges.iges import Iges
+    >>> from iges2vtk.iges.entity import Entity
+    >>> preader = ParameterSectionReader()
+    >>> preader.iges = Iges()
+    >>> preader.iges.global_data_list += [',', ';']
+    >>> e = Entity(type_number=308, pd_pointer=1, structure=0, line_font_pattern=1, level=0, view=0, transformation_pointer=0, label_display_associativity=0, status_number=20201, line_weight=0, color=0, parameter_line_count=1, form=0, entity_label=' SUBFIG1', subscript=0)
+    >>> preader.iges.add_entity(e, 1)
+    >>> line = IgesLine("308,0,6HPADBLK,4,03,05,07,09;                                          1", "P", 1)
     >>> preader.read_line(line)
     >>> preader.pointer
-    0
+    1
     >>> preader.unit_ready()
     True
-    >>> preader.process_unit()
-    >>> preader.iges.entity_dict[0].parameters
-    [308.0, 0.0, 'PADBLK', 4.0, 3.0, 5.0, 7.0, 9.0]
+    >>> preader.process_unit(1)
+
+    Numerical parameters are kept in a float64 array, with NaN in place of
+    the strings, which are kept aside by their index
+
+    >>> preader.iges.entity_dict[1].parameters.tolist()
+    [0.0, nan, 4.0, 3.0, 5.0, 7.0, 9.0]
+    >>> preader.iges.entity_dict[1].string_parameters
+    {1: 'PADBLK'}
     """
 
     def __init__(self) -> None:
         super().__init__()
+        self.delimiter: Optional[str] = None
 
     def read_line(self, line: IgesLine):
         content = line.content
 
+        # the global section is read by now, so it stays the same
+        if self.delimiter is None:
+            self.delimiter = self.iges.delimiter
+
         # -1 because the index in file starts at 1 while python index starts at 0
         # /2 because file index points to the sequence number which increases by 2 per entity
-        pointer = Pointer(content[64:72].replace(' ', '0'))
+        # a blank field is a pointer of 0
+        field = content[64:72]
+        pointer = Pointer(field) if field.strip() else 0
 
         if pointer != self.pointer:
             self.pointer = pointer
@@ -43,19 +59,24 @@ class ParameterSectionReader(SectionReader):
 
         parameters = content[:64].strip()
         parameters = parameters[:-1]  # last is always delimiter or ending
-        self.unit_buffer += parameters.split(self.iges.delimiter)
+        self.unit_buffer.extend(parameters.split(self.delimiter))
 
     def process_unit(self, sequence: int):
 
         try:
 
-            self.unit_buffer = self.unit_buffer[1:]  # remove entity type
-
-            parameters = [self.convert(entry)
-                          for entry in self.unit_buffer if entry != ""]
+            # skips the entity type
+            entries = [entry for entry in islice(self.unit_buffer, 1, None)
+                       if entry != ""]
 
             entity = self.iges.entity_dict[self.pointer]
-            entity.add_parameters(*parameters)
+
+            try:  # most entities are only numbers, parsed in one go
+                parameters = np.array(entries, dtype=np.float64)
+            except ValueError:  # has a hollerith string
+                entity.add_parameters(*map(self.convert, entries))
+            else:
+                entity.add_parameter_array(parameters)
         except KeyError:
             pass
 
@@ -66,13 +87,18 @@ class ParameterSectionReader(SectionReader):
         i = entry.find("H")
 
         if i == -1:  # a numerical value
-            param = float(entry) if entry else float()
+            param = float(entry) if entry else 0.0
 
         else:  # a string value
             param = read_hollerith(entry)
 
         return param
 
+    def end_section(self, sequence: int):
+        super().end_section(sequence)
+        # the next file may use a different delimiter
+        self.delimiter = None
+
     def unit_ready(self) -> bool:
         try:
             entity = self.iges.entity_dict[self.pointer]
@@ -1,5 +1,5 @@
 from collections import namedtuple
-from typing import List, Optional, TextIO
+from typing import Optional, TextIO
 from ..iges import Iges, PreprocessorData
 from abc import ABC, abstractmethod
 from enum import Enum
@@ -12,20 +12,16 @@ def read_hollerith(string: str) -> str:
     Parse a string from a hollerith format.
     Assumes the hollerith format starts at the front of the string.
     """
-    i = 0
-    while string[i] != "H":
-        i += 1
+    i = string.index("H")
     length = int(string[:i])
     # +1 to skip the "H"
     return string[i+1:i+1+length]
 
 
-def chunk_string(string: str, length: int) -> List[str]:
-    """Splits given string into chunks of given length"""
-    return [string[y-length:y] for y in range(length, len(string)+length, length)]
-
 @dataclass
 class IgesLine:
+    __slots__ = ("content", "section", "sequence")
+
     content: str
     section: str
     sequence: int
@@ -60,10 +56,23 @@ class SectionReader(ABC):
         """When a unit is ready, process it."""
         raise NotImplementedError
 
-    @abstractmethod
     def unit_ready(self) -> bool:
-        """Check if a unit is ready"""
-        raise NotImplementedError
+        """
+        Check if a unit is ready.
+        A reader that keeps this default is never asked to process a unit
+        while reading, its whole section is buffered and processed once by
+        `end_section`.
+        """
+        return False
+
+    def end_section(self, sequence: int) -> None:
+        """
+        Called after the last line of the section was read, with its sequence
+        number. Processes whatever is left in the unit buffer, which is the
+        whole section for readers without a `unit_ready` check.
+        """
+        if self.unit_buffer:
+            self.process_unit(sequence)
 
     @abstractmethod
     def reset_unit_buffer(self) -> None: